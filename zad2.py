@@ -1,14 +1,76 @@
-import json
+import inspect
+import numpy as np
+import operator
+import sys
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
+from numba import njit, prange
+
+_STATUS_CODE = {"pending": 0, "in progress": 1, "done": 2}
+_STATUS_STR = ("pending", "in progress", "done")
+_STATUS_DONE = 2
+
+# Below this many tasks the plain numpy compare wins; the JIT kernel only
+# pays off once the arrays are big enough to amortize its dispatch cost.
+_NUMBA_MIN_TASKS = 10_000
+
+
+@njit(parallel=True, cache=True)
+def _overdue_mask(deadlines_i8, status_i8, regular_mask, cur_i8, out):
+    # Fused single-pass version of the three-way boolean combine in
+    # get_overdue_tasks. NaT deadlines view as INT64_MIN but regular_mask is
+    # False for them, so the conjunction keeps them out.
+    for i in prange(deadlines_i8.shape[0]):
+        out[i] = regular_mask[i] and status_i8[i] != _STATUS_DONE and deadlines_i8[i] < cur_i8
+
+
+def _fmt_date(dt):
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+
+
+def _fmt_dt(dt):
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+
+
+def _fmt_dt_min(dt):
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}"
+
+
+# Keys every task serializes in to_dict's kwargs; "created" is restored
+# separately in from_dict, the rest must be accepted by every __init__.
+_TASK_BASE_KEYS = frozenset(("title", "description", "status", "created"))
+
+# Per-subclass constructors specialized at class-creation time: each closure
+# knows the frozenset of kwargs its __init__ accepts, so from_dict avoids a
+# per-key membership loop and dynamic setattr.
+_builders = {}
+
+
+_get_created = operator.attrgetter("created")
+_get_sort_prio = operator.attrgetter("_sort_prio")
+_get_deadline_key = operator.attrgetter("_deadline_key")
 
 
 class Task(ABC):
+    __slots__ = ("title", "description", "_status", "created", "_sort_prio", "_deadline_key")
+
     registry = {}
-    STATUS = ["pending", "in progress", "done"]
+    STATUS = ("pending", "in progress", "done")
+    _PREFIX = "Task"
+    # Bumped on every status/deadline mutation so Project can tell when its
+    # SoA arrays no longer reflect the live tasks, even for assignments that
+    # bypass Project's own methods (next_status, direct t.status = ...).
+    _generation = 0
 
     def __init_subclass__(cls, **kwargs):
+        accepted = frozenset(inspect.signature(cls.__init__).parameters) - {"self"}
+        if not _TASK_BASE_KEYS - {"created"} <= accepted:
+            raise TypeError(f"{cls.__name__}.__init__ must accept title/description/status")
         Task.registry[cls.__name__] = cls
+        cls._PREFIX = cls.__name__
+        _builders[cls.__name__] = (
+            lambda d, _cls=cls, _kw=accepted: _cls(**{k: v for k, v in d.items() if k in _kw})
+        )
         super().__init_subclass__(**kwargs)
 
     def __init__(self, title, description="", status="pending"):
@@ -16,21 +78,35 @@ class Task(ABC):
         self.description = description
         self.status = status
         self.created = datetime.now()
+        # Cached sort keys, kept cheap so Timsort compares plain ints/strings;
+        # subclass setters overwrite them when priority/deadline change.
+        self._sort_prio = 0
+        self._deadline_key = "9999-12-31"
+
+    @property
+    def status(self):
+        return _STATUS_STR[self._status]
+
+    @status.setter
+    def status(self, value):
+        try:
+            self._status = _STATUS_CODE[value]
+        except KeyError:
+            raise ValueError(f"Unknown status: {value}") from None
+        Task._generation += 1
 
     def next_status(self):
-        i = Task.STATUS.index(self.status)
-        if i < len(Task.STATUS) - 1:
-            self.status = Task.STATUS[i + 1]
+        self._status = min(self._status + 1, _STATUS_DONE)
+        Task._generation += 1
 
     def __str__(self):
-        created_str = self.created.strftime("%Y-%m-%d %H:%M")
-        return f"[{self.__class__.__name__}] {self.title} ({self.status}) - utw: {created_str}"
+        return f"[{self._PREFIX}] {self.title} ({self.status}) - utw: {_fmt_dt_min(self.created)}"
 
     def __lt__(self, other):
         return self.created < other.created
 
     def __eq__(self, other):
-        return self.title == other.title and self.status == other.status
+        return self.title == other.title and self._status == other._status
 
     def to_dict(self):
         return {
@@ -39,39 +115,44 @@ class Task(ABC):
                 "title": self.title,
                 "description": self.description,
                 "status": self.status,
-                "created": self.created.strftime("%Y-%m-%d %H:%M:%S"),
+                "created": self.created,
             }
         }
 
     @classmethod
     def from_dict(cls, data):
         task_type = data["task_type"]
-        if task_type not in Task.registry:
+        builder = _builders.get(task_type)
+        if builder is None:
             raise ValueError(f"Unknown task type: {task_type}")
 
-        task_class = Task.registry[task_type]
         kwargs = data.get("kwargs", {})
-
-        obj = task_class(
-            title=kwargs.get("title", ""),
-            description=kwargs.get("description", ""),
-            status=kwargs.get("status", "pending")
-        )
-
-        for key, value in kwargs.items():
-            if key not in ["title", "description", "status", "created"]:
-                setattr(obj, key, value)
-
-        if "created" in data:
-            obj.created = datetime.strptime(data["created"], "%Y-%m-%d %H:%M:%S")
+        obj = builder(kwargs)
+        if "created" in kwargs:
+            created = kwargs["created"]
+            # to_dict keeps created as a datetime; it only becomes a string
+            # once the dict has been through a JSON encode/decode.
+            obj.created = created if isinstance(created, datetime) else datetime.fromisoformat(created)
         return obj
 
 
 class RegularTask(Task):
+    __slots__ = ("_deadline",)
+
     def __init__(self, title, description="", status="pending", deadline=None):
         super().__init__(title, description, status)
         self.deadline = deadline
 
+    @property
+    def deadline(self):
+        return self._deadline
+
+    @deadline.setter
+    def deadline(self, value):
+        self._deadline = value
+        self._deadline_key = value or "9999-12-31"
+        Task._generation += 1
+
     def __str__(self):
         return f"[ ] {self.title} ({self.status}) - deadline: {self.deadline}"
 
@@ -82,51 +163,135 @@ class RegularTask(Task):
 
 
 class PriorityTask(Task):
+    __slots__ = ("_priority",)
+
     PRIORITY_ORDER = {"HIGH": 3, "MEDIUM": 2, "LOW": 1}
 
     def __init__(self, title, description="", status="pending", priority="MEDIUM"):
         super().__init__(title, description, status)
-        self.priority = priority.upper()
+        self.priority = priority
+
+    @property
+    def priority(self):
+        return self._priority
+
+    @priority.setter
+    def priority(self, value):
+        self._priority = value.upper()
+        # Negated so an ascending sort puts HIGH first.
+        self._sort_prio = -PriorityTask.PRIORITY_ORDER.get(self._priority, 0)
 
     def __str__(self):
         return f"[!] {self.title} ({self.status}) - priorytet: {self.priority}"
 
     def to_dict(self):
-        return {**super().to_dict(), "priority": self.priority}
+        data = super().to_dict()
+        data["kwargs"]["priority"] = self._priority
+        return data
 
 
 class RecurringTask(Task):
+    __slots__ = ("_interval_days", "_start_dt", "_start_str", "_next_dt", "_next_str")
+
     def __init__(self, title, description="", status="pending", interval_days=7, start_date=None):
         super().__init__(title, description, status)
-        self.interval_days = interval_days
-        self.start_date = start_date or datetime.now().strftime("%Y-%m-%d")
+        self._interval_days = interval_days
+        if isinstance(start_date, str):
+            self._start_dt = datetime.fromisoformat(start_date)
+        else:
+            self._start_dt = start_date or datetime.now()
+        self._refresh_cache()
+
+    def _refresh_cache(self):
+        self._start_str = _fmt_date(self._start_dt)
+        self._next_dt = self._start_dt + timedelta(days=self._interval_days)
+        self._next_str = _fmt_date(self._next_dt)
+
+    @property
+    def interval_days(self):
+        return self._interval_days
+
+    @interval_days.setter
+    def interval_days(self, value):
+        self._interval_days = value
+        self._refresh_cache()
+
+    @property
+    def start_date(self):
+        return self._start_str
+
+    @start_date.setter
+    def start_date(self, value):
+        if isinstance(value, str):
+            self._start_dt = datetime.fromisoformat(value)
+        else:
+            self._start_dt = value
+        self._refresh_cache()
 
     def __str__(self):
-        next_date = (datetime.strptime(self.start_date, "%Y-%m-%d") +
-                     timedelta(days=self.interval_days)).strftime("%Y-%m-%d")
-        return f"[o] {self.title} ({self.status}) - co {self.interval_days} dni (nastepne: {next_date})"
+        return f"[o] {self.title} ({self.status}) - co {self._interval_days} dni (nastepne: {self._next_str})"
 
     def to_dict(self):
-        return {**super().to_dict(), "interval_days": self.interval_days, "start_date": self.start_date}
+        data = super().to_dict()
+        data["kwargs"]["interval_days"] = self._interval_days
+        data["kwargs"]["start_date"] = self._start_str
+        return data
 
 
 class Project:
+    __slots__ = ("name", "tasks", "current_date", "_by_title",
+                 "_deadline_arr", "_regular_mask", "_status_arr", "_arrays_stale",
+                 "_arrays_gen")
+
     def __init__(self, name):
         self.name = name
         self.tasks = []
         self.current_date = datetime.now()
+        self._by_title = {}
+        self._arrays_stale = True
+        self._arrays_gen = -1
 
     def set_date(self, new_date):
         if isinstance(new_date, str):
-            self.current_date = datetime.strptime(new_date, "%Y-%m-%d")
+            self.current_date = datetime.fromisoformat(new_date)
         else:
             self.current_date = new_date
-        print(f"Data projektu ustawiona na: {self.current_date.strftime('%Y-%m-%d')}")
+        print(f"Data projektu ustawiona na: {_fmt_date(self.current_date)}")
 
     def add_task(self, task):
         self.tasks.append(task)
+        # setdefault keeps the first task under a duplicated title, matching
+        # the old first-match semantics of the linear scan.
+        self._by_title.setdefault(task.title, task)
+        self._arrays_stale = True
         print(f"Dodano zadanie: {task.title}")
 
+    def _rebuild_index(self):
+        index = {}
+        for t in self.tasks:
+            index.setdefault(t.title, t)
+        self._by_title = index
+
+    def _rebuild_arrays(self):
+        # SoA mirror of self.tasks: deadlines as datetime64[D] (NaT where not
+        # applicable), status as int8 codes, plus a "RegularTask with deadline"
+        # mask. Rebuilt lazily whenever the task list or statuses change.
+        tasks = self.tasks
+        n = len(tasks)
+        deadlines = np.full(n, np.datetime64("NaT"), dtype="datetime64[D]")
+        regular = np.zeros(n, dtype=bool)
+        status = np.empty(n, dtype=np.int8)
+        for i, t in enumerate(tasks):
+            status[i] = t._status
+            if isinstance(t, RegularTask) and t.deadline:
+                regular[i] = True
+                deadlines[i] = np.datetime64(t.deadline)
+        self._deadline_arr = deadlines
+        self._regular_mask = regular
+        self._status_arr = status
+        self._arrays_stale = False
+        self._arrays_gen = Task._generation
+
     def __iter__(self):
         return iter(self.tasks)
 
@@ -134,116 +299,146 @@ class Project:
         if not self.tasks:
             print("Brak zadan.")
             return
+        tasks = self.tasks
         print(f"\n===== Zadania w projekcie '{self.name}' =====")
-        for t in self.tasks:
-            print("-", t)
+        sys.stdout.write("- " + "\n- ".join(str(t) for t in tasks) + "\n")
 
     def get_active_tasks(self):
-        return [t for t in self.tasks if t.status != "done"]
+        tasks = self.tasks
+        return [t for t in tasks if t._status != _STATUS_DONE]
 
     def get_overdue_tasks(self):
-        overdue = []
-        for t in self.tasks:
-            if isinstance(t, RegularTask) and t.deadline and t.status != "done":
-                deadline = datetime.strptime(t.deadline, "%Y-%m-%d")
-                if deadline < self.current_date:
-                    overdue.append(t)
-        return overdue
+        tasks = self.tasks
+        if not tasks:
+            return []
+        if self._arrays_stale or self._arrays_gen != Task._generation:
+            self._rebuild_arrays()
+        cur = np.datetime64(self.current_date.date(), "D")
+        if len(tasks) >= _NUMBA_MIN_TASKS:
+            mask = np.empty(len(tasks), dtype=np.bool_)
+            _overdue_mask(self._deadline_arr.view(np.int64), self._status_arr,
+                          self._regular_mask, cur.astype(np.int64), mask)
+        else:
+            mask = self._regular_mask & (self._deadline_arr < cur) & (self._status_arr != _STATUS_DONE)
+        return [tasks[i] for i in np.flatnonzero(mask)]
 
     def mark_task_done(self, title):
-        for t in self.tasks:
-            if t.title == title:
-                t.status = "done"
-                print(f"Zadanie '{title}' oznaczono jako 'done'.")
-                return
-        print("Nie znaleziono zadania.")
+        t = self._by_title.get(title)
+        if t is None:
+            print("Nie znaleziono zadania.")
+            return
+        t.status = "done"
+        print(f"Zadanie '{title}' oznaczono jako 'done'.")
 
     def mark_task_in_progress(self, title):
-        for t in self.tasks:
-            if t.title == title:
-                t.status = "in progress"
-                print(f"Zadanie '{title}' oznaczono jako 'in progress'.")
-                return
-        print("Nie znaleziono zadania.")
+        t = self._by_title.get(title)
+        if t is None:
+            print("Nie znaleziono zadania.")
+            return
+        t.status = "in progress"
+        print(f"Zadanie '{title}' oznaczono jako 'in progress'.")
 
     def sort_tasks(self, criterion="created"):
         if criterion == "deadline":
-            self.tasks.sort(key=lambda t: getattr(t, 'deadline', '9999-12-31'))
+            self.tasks.sort(key=_get_deadline_key)
         elif criterion == "priority":
-            self.tasks.sort(key=lambda t: -PriorityTask.PRIORITY_ORDER.get(getattr(t, 'priority', ''), 0))
+            self.tasks.sort(key=_get_sort_prio)
         else:
-            self.tasks.sort()
+            self.tasks.sort(key=_get_created)
+        self._arrays_stale = True
         print(f"Zadania posortowane wedlug: {criterion}")
 
+    def _iter_json_chunks(self):
+        # Streams the project as JSON fragments, one task at a time, so
+        # serialization never holds a full list-of-dicts next to the encoded
+        # output. orjson returns independent bytes per call, which makes the
+        # per-task dumps safe to concatenate.
+        import orjson
+
+        dumps = orjson.dumps
+        yield (b'{"name":' + dumps(self.name)
+               + b',"current_date":' + dumps(_fmt_dt(self.current_date))
+               + b',"tasks":[')
+        sep = b""
+        for t in self.tasks:
+            yield sep + dumps(t.to_dict(), option=orjson.OPT_NON_STR_KEYS)
+            sep = b","
+        yield b"]}"
+
     def to_json(self):
-        data = {
-            "name": self.name,
-            "current_date": self.current_date.strftime("%Y-%m-%d %H:%M:%S"),
-            "tasks": [t.to_dict() for t in self.tasks]
-        }
-        return json.dumps(data, indent=2, ensure_ascii=False)
+        buf = bytearray()
+        for chunk in self._iter_json_chunks():
+            buf += chunk
+        return buf.decode()
 
     @classmethod
     def from_json(cls, json_str):
-        data = json.loads(json_str)
+        import orjson
+
+        data = orjson.loads(json_str)
         project = cls(data.get("name", "Unnamed Project"))
 
         if "current_date" in data:
-            project.current_date = datetime.strptime(data["current_date"], "%Y-%m-%d %H:%M:%S")
+            project.current_date = datetime.fromisoformat(data["current_date"])
 
         for task_data in data.get("tasks", []):
             project.tasks.append(Task.from_dict(task_data))
+        project._rebuild_index()
 
         return project
 
     def save(self, filename="tasks.json"):
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump({
-                "name": self.name,
-                "current_date": self.current_date.strftime("%Y-%m-%d %H:%M:%S"),
-                "tasks": [t.to_dict() for t in self.tasks]
-            }, f, indent=2, ensure_ascii=False)
+        with open(filename, "wb") as f:
+            f.writelines(self._iter_json_chunks())
         print(f"Zapisano do {filename}")
 
     def load(self, filename="tasks.json"):
+        import orjson
+
         try:
-            with open(filename, encoding="utf-8") as f:
-                data = json.load(f)
+            with open(filename, "rb") as f:
+                data = orjson.loads(f.read())
                 self.name = data.get("name", self.name)
                 if "current_date" in data:
-                    self.current_date = datetime.strptime(data["current_date"], "%Y-%m-%d %H:%M:%S")
+                    self.current_date = datetime.fromisoformat(data["current_date"])
                 self.tasks = [Task.from_dict(d) for d in data.get("tasks", [])]
+                self._rebuild_index()
+                self._arrays_stale = True
             print(f"Wczytano z {filename}")
         except FileNotFoundError:
             print("Nie ma pliku.")
 
 
+_MENU = """
+===== MENU =====
+1. Dodaj RegularTask
+2. Dodaj PriorityTask
+3. Dodaj RecurringTask
+4. Pokaż wszystkie zadania
+5. Pokaż zadania aktywne
+6. Pokaż zadania po terminie
+7. Oznacz zadanie jako 'in progress'
+8. Oznacz zadanie jako 'done'
+9. Sortuj zadania
+10. Ustaw datę projektu
+11. Zapisz do pliku
+12. Wczytaj z pliku
+0. Zakończ"""
+
+
 def main():
     project = Project("Moje zadania")
 
     while True:
-        print("\n===== MENU =====")
-        print("1. Dodaj RegularTask")
-        print("2. Dodaj PriorityTask")
-        print("3. Dodaj RecurringTask")
-        print("4. Pokaż wszystkie zadania")
-        print("5. Pokaż zadania aktywne")
-        print("6. Pokaż zadania po terminie")
-        print("7. Oznacz zadanie jako 'in progress'")
-        print("8. Oznacz zadanie jako 'done'")
-        print("9. Sortuj zadania")
-        print("10. Ustaw datę projektu")
-        print("11. Zapisz do pliku")
-        print("12. Wczytaj z pliku")
-        print("0. Zakończ")
+        print(_MENU)
 
         choice = input("Wybierz: ")
 
         if choice == "1":
             title = input("Tytuł: ")
             desc = input("Opis: ")
-            deadline = input("Deadline (YYYY-MM-DD lub Enter): ") or (datetime.now() + timedelta(days=7)).strftime(
-                "%Y-%m-%d")
+            deadline_in = input("Deadline (YYYY-MM-DD lub Enter): ")
+            deadline = deadline_in if deadline_in else _fmt_date(datetime.now() + timedelta(days=7))
             project.add_task(RegularTask(title, desc, deadline=deadline))
 
         elif choice == "2":
@@ -264,16 +459,17 @@ def main():
 
         elif choice == "5":
             print("\n===== Zadania aktywne =====")
-            for t in project.get_active_tasks():
-                print("-", t)
+            active = project.get_active_tasks()
+            if active:
+                sys.stdout.write("- " + "\n- ".join(str(t) for t in active) + "\n")
 
         elif choice == "6":
             print("\n===== Zadania po terminie =====")
             overdue = project.get_overdue_tasks()
             if not overdue:
                 print("Brak zadan po terminie.")
-            for t in overdue:
-                print("-", t)
+            else:
+                sys.stdout.write("- " + "\n- ".join(str(t) for t in overdue) + "\n")
 
         elif choice == "7":
             title = input("Podaj tytu zadania: ")